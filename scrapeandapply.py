@@ -2,24 +2,31 @@
 Dice Auto Apply Bot
 -------------------
 Automates job searches and Easy Apply submissions on Dice.com
-using Playwright and BeautifulSoup.
+using Playwright and HTTPX.
 
 Author: Krishna Yalamarthi
 License: MIT
 """
 
 import os
-import requests
+import httpx
 import pandas as pd
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, Page, TimeoutError as PWTimeoutError
+from playwright.async_api import (
+    async_playwright, Browser, Page, Playwright, Route, TimeoutError as PWTimeoutError
+)
 import time
-import random
-from playwright.sync_api import Page, TimeoutError as PWTimeoutError
+import asyncio
+import re
+import html
+import threading
+import itertools
+from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 # ------------ Search configuration ------------
+DICE_ORIGIN = "https://www.dice.com"
 BASE_URL = (
-    "https://www.dice.com/jobs"
+    f"{DICE_ORIGIN}/jobs"
     "?filters.postedDate=THIRTY"
     #"&filters.employmentType=CONTRACTS%7CTHIRD_PARTY"
     #"&radius=30"
@@ -41,20 +48,70 @@ HEADERS = {
     )
 }
 
+# Number of result pages fetched concurrently (keep <= client max_connections)
+PAGE_FETCH_WORKERS = 8
+
+# Overall request rate (per second) for result pages, across all fetch threads
+PAGE_FETCH_RPS = 4
+
+# Shared HTTP/2 client: result pages are multiplexed over one compressed connection
+CLIENT = httpx.Client(
+    headers={**HEADERS, "Accept-Encoding": "gzip, deflate, br"},
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    ),
+    timeout=15,
+)
+
 # ------------ Login & automation settings ------------
-DICE_LOGIN_URL = "https://www.dice.com/dashboard/login"
+DICE_LOGIN_URL = f"{DICE_ORIGIN}/dashboard/login"
+DICE_DASHBOARD_URL = f"{DICE_ORIGIN}/dashboard"
 
 # ⚠️ Replace these placeholders with your own credentials before running
 USERNAME = "rajendar.talatam@gmail.com"
 PASSWORD = "@Oracle3sssssw2wss8"
 LOCAL_RESUME = "Rajendar_Talatam _Resume.docx"
 
+# Number of browser contexts (in one browser) applying to jobs in parallel
+APPLY_WORKERS = 4
+
+# Saved login session, shared by the apply workers and reused across runs
+AUTH_FILE = "auth.json"
+
 # Wait time (in seconds) between job applications to mimic human behavior
 PER_JOB_WAIT_SECONDS = 3
 
+# Chromium launch options; set HEADLESS = False to watch the browser
+HEADLESS = True
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--no-first-run",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-features=TranslateUI,BackForwardCache",
+]
+
+# Optional DevTools endpoint of an already running Chromium to share between runs,
+# e.g. started with: chromium --remote-debugging-port=9222 --user-data-dir=/tmp/dice
+CDP_ENDPOINT = None  # "http://127.0.0.1:9222"
+
+# Requests aborted in the apply contexts; none of them affect the Easy Apply flow.
+# Stylesheets are kept because visibility checks depend on computed styles.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_DOMAINS = ("googletagmanager", "doubleclick", "google-analytics", "segment.io")
+
 # ------------ File to track already processed jobs ------------
 SEEN_FILE = "seen_links.txt"
 
+# Number of processed links buffered before they are written out
+SEEN_FLUSH_EVERY = 16
+
 
 def load_seen_links(path: str = SEEN_FILE) -> set[str]:
     """Load previously applied job links from file to avoid duplicates."""
@@ -64,32 +121,91 @@ def load_seen_links(path: str = SEEN_FILE) -> set[str]:
         return set(line.strip() for line in f if line.strip())
 
 
-def append_seen_link(link: str, path: str = SEEN_FILE) -> None:
-    """Append a processed job link to the tracking file."""
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(link + "\n")
+class SeenLinkWriter:
+    """Append processed job links to the tracking file in batches.
+
+    One O_APPEND descriptor is kept for the whole run and links are written
+    every ``batch_size`` additions and on close. Callers serialize access.
+    """
+
+    def __init__(self, path: str = SEEN_FILE, batch_size: int = SEEN_FLUSH_EVERY):
+        self.fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.batch_size = batch_size
+        self.buf: list[str] = []
+
+    def add(self, link: str) -> None:
+        self.buf.append(link + "\n")
+        if len(self.buf) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buf:
+            os.write(self.fd, "".join(self.buf).encode("utf-8"))
+            self.buf.clear()
+
+    def close(self) -> None:
+        self.flush()
+        os.close(self.fd)
 
 
 # ------------ Scraping logic ------------
+# Result pages are only read through these patterns, so no HTML parser is needed
+PAGE_RE = re.compile(r'aria-label="Page\s+\d+\s+of\s+(\d+)"')
+LINK_RE = re.compile(
+    r'<a\s([^>]*data-testid="job-search-job-detail-link"[^>]*)>(.*?)</a>', re.S
+)
+HREF_RE = re.compile(r'(?:^|\s)href="([^"]*)"')
+TAG_RE = re.compile(r"<[^>]+>")
+
+
 def get_total_pages(html_text: str) -> int:
     """Extract total page count from the first result page."""
-    soup = BeautifulSoup(html_text, "html.parser")
-    sec = soup.find("section", {"aria-label": lambda lbl: lbl and "Page" in lbl})
-    if not sec:
-        return 1
-    label = sec.get("aria-label", "")
+    m = PAGE_RE.search(html_text)
+    return int(m.group(1)) if m else 1
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls ``1 / rps`` seconds apart."""
+
+    def __init__(self, rps: float):
+        self.interval = 1 / rps
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self.interval
+        time.sleep(wait)
+
+
+PAGE_RATE_LIMITER = RateLimiter(PAGE_FETCH_RPS)
+
+
+def fetch_page(url: str) -> httpx.Response | None:
+    """Fetch one result page, returning None if it could not be loaded."""
+    # polite pause, shared by all fetch threads
+    PAGE_RATE_LIMITER.acquire()
     try:
-        _, total = [int(n) for n in label.replace("Page", "").replace("of", "").split()]
-    except ValueError:
-        total = 1
-    return total
+        resp = CLIENT.get(url)
+        if resp.status_code != 200:
+            print(f"  ⚠️ Failed to load {url} (status {resp.status_code})")
+            return None
+    except Exception as e:
+        print(f"  ⚠️ Failed to load {url}: {e}")
+        return None
+    return resp
 
 
-def scrape_job_listings() -> list[dict]:
-    """Scrape all job listings matching the search criteria."""
+def scrape_job_listings(already_seen: set[str] | None = None) -> list[dict]:
+    """Scrape all job listings matching the search criteria.
+
+    Links in ``already_seen`` (previously processed jobs) are skipped.
+    """
     jobs: list[dict] = []
     try:
-        first_res = requests.get(BASE_URL + "1", headers=HEADERS, timeout=15)
+        first_res = CLIENT.get(f"{BASE_URL}1")
         first_res.raise_for_status()
         first_page = first_res.text
     except Exception:
@@ -98,97 +214,126 @@ def scrape_job_listings() -> list[dict]:
     total_pages = get_total_pages(first_page)
     print(f"Detected {total_pages} pages.")
 
-    for p in range(1, total_pages + 1):
-        url = BASE_URL + str(p)
-        print(f"Scraping job list (page {p}/{total_pages})...")
+    seen_hrefs: set[str] = set()
+    urls = [f"{BASE_URL}{p}" for p in range(1, total_pages + 1)]
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as ex:
+        responses = list(ex.map(fetch_page, urls))
 
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=15)
-            if resp.status_code != 200:
-                print(f"  ⚠️ Failed to load page {p} (status {resp.status_code})")
-                continue
-        except Exception as e:
-            print(f"  ⚠️ Failed to load page {p}: {e}")
+    for p, resp in enumerate(responses, start=1):
+        print(f"Scraping job list (page {p}/{total_pages})...")
+        if resp is None:
             continue
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        links = soup.find_all("a", {"data-testid": "job-search-job-detail-link"})
-        for a in links:
-            title = a.get_text(strip=True)
-            href = a.get("href")
-            if not href:
+        for attrs, inner in LINK_RE.findall(resp.text):
+            m = HREF_RE.search(attrs)
+            if not m or not m.group(1):
                 continue
+            href = html.unescape(m.group(1))
             if href.startswith("/"):
-                href = "https://www.dice.com" + href
+                href = DICE_ORIGIN + href
+            if href in seen_hrefs or (already_seen and href in already_seen):
+                continue
+            seen_hrefs.add(href)
+            title = html.unescape(TAG_RE.sub("", inner)).strip()
             jobs.append({"Job Title": title, "Job Link": href})
 
-        # polite pause between requests
-        time.sleep(random.uniform(0.2, 0.5))
-
-    # De-duplicate job links
-    seen = set()
-    deduped = []
-    for j in jobs:
-        if j["Job Link"] in seen:
-            continue
-        seen.add(j["Job Link"])
-        deduped.append(j)
-    print(f"Found {len(deduped)} unique jobs.")
-    return deduped
+    print(f"Found {len(jobs)} new unique jobs.")
+    return jobs
 
 
 # ------------ Playwright helpers ------------
-def login(page: Page):
+async def launch_browser(pw: Playwright) -> Browser:
+    """Connect to the shared Chromium if configured, else launch a tuned one.
+
+    Closing a browser obtained over CDP only drops our contexts and disconnects;
+    the shared Chromium process keeps running.
+    """
+    if CDP_ENDPOINT:
+        return await pw.chromium.connect_over_cdp(CDP_ENDPOINT)
+    return await pw.chromium.launch(headless=HEADLESS, args=CHROMIUM_ARGS)
+
+
+async def block_heavy_resources(route: Route) -> None:
+    """Abort images, fonts, media and tracker requests; let the rest through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        d in request.url for d in BLOCKED_DOMAINS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def login(page: Page):
     """Automate login flow for Dice using Playwright."""
-    page.goto(DICE_LOGIN_URL)
-    page.fill('input[name="email"]', USERNAME)
-    page.get_by_test_id("sign-in-button").click()
+    await page.goto(DICE_LOGIN_URL)
+    await page.fill('input[name="email"]', USERNAME)
+    await page.get_by_test_id("sign-in-button").click()
 
     # Wait for password field
-    page.wait_for_selector('input[name="password"]', timeout=60_000)
-    page.fill('input[name="password"]', PASSWORD)
-    page.get_by_test_id("submit-password").click()
+    await page.wait_for_selector('input[name="password"]', timeout=60_000)
+    await page.fill('input[name="password"]', PASSWORD)
+    await page.get_by_test_id("submit-password").click()
 
-    # Wait until fully logged in
-    page.wait_for_load_state("networkidle", timeout=120_000)
+    # Wait until Dice redirects away from the login page
+    await page.wait_for_url(lambda url: "/login" not in url, timeout=30_000)
     print("Logged in successfully.")
 
 
+async def is_logged_in(page: Page) -> bool:
+    """Check whether the current context still has a valid Dice session."""
+    try:
+        await page.goto(DICE_DASHBOARD_URL, wait_until="domcontentloaded", timeout=30_000)
+    except PWTimeoutError:
+        return False
+    except Exception:
+        return False
+    # Dice redirects to the login page when the session has expired
+    return "/login" not in page.url
+
 
-def has_easy_apply(page: Page) -> bool:
+async def has_easy_apply(page: Page) -> bool:
     """Check whether a job listing supports 'Easy Apply' on Dice."""
     try:
-        # ✅ NEW Dice layout (anchor tag)
-        time.sleep(3)
-        # ...existing code...
-        easy_link = page.locator(
-            "a[data-testid='apply-button']",
-            has_text="Easy Apply"
-        )
-        # Also consider "Apply" button
-        apply_link = page.locator(
-            "a[data-testid='apply-button']",
-            has_text="Apply"
+        # ✅ NEW Dice layout (anchor tag). The page is navigated with
+        # wait_until="commit", so this bounded wait also covers the page load;
+        # listings without a button (expired, already applied) give up after it.
+        await page.wait_for_selector("a[data-testid='apply-button']", timeout=10_000)
+        # "Easy Apply" and "Apply" buttons, checked in one round-trip to the page.
+        # A locator (unlike document.querySelectorAll) also matches inside shadow roots.
+        return await page.locator("a[data-testid='apply-button']").evaluate_all(
+            """els => els.some(a => a.getClientRects().length > 0
+                                && (a.innerText || "").toLowerCase().includes("apply"))"""
         )
-        if (easy_link.count() > 0 and easy_link.first.is_visible()) or \
-           (apply_link.count() > 0 and apply_link.first.is_visible()):
-            return True
     except PWTimeoutError:
         return False
     except Exception:
         return False
-    return False
-def click_when_enabled(page, text, timeout=30_000):
+async def click_when_enabled(page, text, timeout=30_000):
     btn = page.locator(f'button:has-text("{text}")')
-    btn.wait_for(state="visible", timeout=timeout)
-    btn.wait_for(state="enabled", timeout=timeout)
-    btn.first.click()
+    await btn.wait_for(state="visible", timeout=timeout)
+    await btn.wait_for(state="enabled", timeout=timeout)
+    await btn.first.click()
+
+async def click_step_button(locator, timeout=5_000):
+    """Click a step button and wait for that exact element to go away.
+
+    Waiting on the clicked handle rather than the locator matters: the next
+    step has its own "Next" button, which the locator would resolve to at once.
+    """
+    handle = await locator.element_handle()
+    await handle.click()
+    try:
+        await handle.wait_for_element_state("hidden", timeout=timeout)
+    except PWTimeoutError:
+        pass
 
-def easy_apply_on_job(page: Page, job_url: str) -> bool:
+async def easy_apply_on_job(page: Page, job_url: str) -> bool:
     """Open a job link and complete the Easy Apply process if available."""
     try:
-        page.goto(job_url, wait_until="domcontentloaded")
-        if not has_easy_apply(page):
+        # Don't wait for the DOM here; has_easy_apply waits for the apply button itself
+        await page.goto(job_url, wait_until="commit", timeout=30_000)
+        if not await has_easy_apply(page):
             print("  Skipping (no Easy apply):", job_url)
             return False
 
@@ -203,37 +348,44 @@ def easy_apply_on_job(page: Page, job_url: str) -> bool:
             has_text="Apply"
         )
 
-        easy_apply.wait_for(state="visible", timeout=30_000)
-        easy_apply.click()
+        await easy_apply.wait_for(state="visible", timeout=30_000)
+        await easy_apply.click()
 
         # # Replace resume
-        # page.wait_for_selector('button.file-remove', timeout=10_000)
-        # page.click('button.file-remove:has-text("Replace")')
-        # page.wait_for_selector('input#fsp-fileUpload', timeout=10_000)
-        # page.set_input_files('input#fsp-fileUpload', LOCAL_RESUME)
-        # page.wait_for_timeout(1200)
+        # await page.wait_for_selector('button.file-remove', timeout=10_000)
+        # await page.click('button.file-remove:has-text("Replace")')
+        # await page.wait_for_selector('input#fsp-fileUpload', timeout=10_000)
+        # await page.set_input_files('input#fsp-fileUpload', LOCAL_RESUME)
+        # await page.wait_for_selector('span[data-e2e="upload"]:not([disabled])', timeout=10_000)
 
         # # Upload the file
-        # page.wait_for_selector('span[data-e2e="upload"]', timeout=10_000)
-        # page.click('span[data-e2e="upload"]')
-        # page.wait_for_timeout(1200)
+        # await page.wait_for_selector('span[data-e2e="upload"]', timeout=10_000)
+        # await page.click('span[data-e2e="upload"]')
+        # await page.wait_for_selector('button:has-text("Next")', state="visible", timeout=10_000)
 
         # Navigate through steps until submission
         for _ in range(8):  # Dice usually 3–6 steps
+            # Only visible buttons count; hidden copies may come first in the DOM
+            submit_btn = page.locator('button:has-text("Submit"):visible')
+            next_btn = page.locator('button:has-text("Next"):visible')
+
+            # Wait for the next actionable button instead of a fixed sleep
+            try:
+                await page.locator(
+                    'button:has-text("Submit"):visible, button:has-text("Next"):visible'
+                ).first.wait_for(timeout=10_000)
+            except PWTimeoutError:
+                break
+
             # ✅ Submit (final step)
-            time.sleep(3)
-            submit_btn = page.locator('button:has-text("Submit")')
-            if submit_btn.count() > 0 and submit_btn.first.is_visible():
-                submit_btn.first.click()
-                page.wait_for_timeout(1500)
+            if await submit_btn.count() > 0:
+                await click_step_button(submit_btn.first)
                 print("  Submitted ✔")
                 return True
 
             # ➡️ Next step
-            next_btn = page.locator('button:has-text("Next")')
-            if next_btn.count() > 0 and next_btn.first.is_visible():
-                next_btn.first.click()
-                page.wait_for_timeout(1200)
+            if await next_btn.count() > 0:
+                await click_step_button(next_btn.first)
                 continue
 
             # 🛑 Nothing actionable
@@ -248,45 +400,97 @@ def easy_apply_on_job(page: Page, job_url: str) -> bool:
         return False
 
 
+async def apply_worker(
+    browser: Browser,
+    links: list[str],
+    progress: Iterator[int],
+    total: int,
+    seen_writer: SeenLinkWriter,
+    seen_links: set[str],
+) -> int:
+    """Apply to a batch of jobs in its own browser context; return submissions.
+
+    ``progress`` is shared by all workers and numbers jobs across the whole run.
+    """
+    submitted = 0
+    context = await browser.new_context(storage_state=AUTH_FILE)
+    await context.route("**/*", block_heavy_resources)
+    page = await context.new_page()
+    try:
+        for link in links:
+            print(f"\n[{next(progress)}/{total}] {link}")
+            applied = await easy_apply_on_job(page, link)
+
+            # Log this job link to prevent reapplying. Workers share one event
+            # loop and this block has no await, so no lock is needed.
+            seen_writer.add(link)
+            seen_links.add(link)
+
+            if applied:
+                submitted += 1
+
+            await asyncio.sleep(PER_JOB_WAIT_SECONDS)
+    finally:
+        await context.close()
+    return submitted
+
+
+async def apply_to_jobs(
+    links: list[str], seen_writer: SeenLinkWriter, seen_links: set[str]
+) -> int:
+    """Log in and apply to ``links`` across APPLY_WORKERS contexts of one browser."""
+    async with async_playwright() as pw:
+        browser = await launch_browser(pw)
+        try:
+            # Log in once (or reuse a saved session) and share it with every worker
+            has_auth = os.path.exists(AUTH_FILE)
+            context = await browser.new_context(
+                storage_state=AUTH_FILE if has_auth else None
+            )
+            page = await context.new_page()
+            if has_auth and await is_logged_in(page):
+                print("Reusing saved login session.")
+            else:
+                await login(page)
+                await context.storage_state(path=AUTH_FILE)
+            await context.close()
+
+            # Round-robin the links across workers, one browser context each
+            workers = min(APPLY_WORKERS, len(links))
+            progress = itertools.count(1)
+            results = await asyncio.gather(*(
+                apply_worker(
+                    browser, links[w::workers], progress, len(links), seen_writer, seen_links
+                )
+                for w in range(workers)
+            ))
+        finally:
+            await browser.close()
+    return sum(results)
+
+
 # ------------ Main orchestrator ------------
 def main():
     """Entry point for the automation."""
-    jobs = scrape_job_listings()
-    links = [j["Job Link"] for j in jobs]
-
     seen_links = load_seen_links()
-    new_links = [lnk for lnk in links if lnk not in seen_links]
+    try:
+        jobs = scrape_job_listings(seen_links)
+    finally:
+        CLIENT.close()
+    new_links = [j["Job Link"] for j in jobs]
     print(f"{len(new_links)} new links to process; {len(seen_links)} already seen.")
 
     if not new_links:
         print("Nothing new. Exiting.")
         return
 
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=False)
-        page = browser.new_page()
-
-        login(page)
-
-        submitted = 0
-        for i, link in enumerate(new_links, start=1):
-            print(f"\n[{i}/{len(new_links)}] {link}")
-            applied = easy_apply_on_job(page, link)
-
-            # Log this job link to prevent reapplying
-            append_seen_link(link)
-            seen_links.add(link)
-
-            if applied:
-                submitted += 1
-
-            time.sleep(PER_JOB_WAIT_SECONDS)
-
+    seen_writer = SeenLinkWriter()
+    try:
+        submitted = asyncio.run(apply_to_jobs(new_links, seen_writer, seen_links))
         print(f"\nDone. Submitted: {submitted} / Attempted: {len(new_links)}")
-        page.wait_for_timeout(2000)
-        browser.close()
+    finally:
+        seen_writer.close()
 
 
 if __name__ == "__main__":
     main()
-